@@ -1,37 +1,73 @@
+import json
+import os
+import threading
+
 import requests
+from cachetools import TTLCache
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
 
 # Base URLs for free services
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Shared session so connections (and TLS handshakes) are pooled and reused
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({"User-Agent": "maritime-assistant"})
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=3)
+HTTP_SESSION.mount("https://", _adapter)
+HTTP_SESSION.mount("http://", _adapter)
+
+# Port coordinates barely change; keep Nominatim hits on disk across restarts
+PORT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "port_cache")
+PORT_CACHE_TTL = 86400  # seconds
+_port_cache = Cache(PORT_CACHE_DIR)
+
 def get_port_coordinates(port_name, country=None):
     """
     Get latitude & longitude of a port using OpenStreetMap (Nominatim API).
+    Hits are cached for PORT_CACHE_TTL; misses are not, so they get retried.
     """
     query = port_name if not country else f"{port_name}, {country}"
+    cached_coords = _port_cache.get(query)
+    if cached_coords is not None:
+        return cached_coords
     params = {"q": query, "format": "json", "limit": 1}
-    response = requests.get(
-        NOMINATIM_URL, 
-        params=params, 
-        headers={"User-Agent": "maritime-assistant"}
-    )
+    response = HTTP_SESSION.get(NOMINATIM_URL, params=params)
     data = response.json()
     if not data:
         return None
-    return float(data[0]["lat"]), float(data[0]["lon"])
+    coords = float(data[0]["lat"]), float(data[0]["lon"])
+    _port_cache.set(query, coords, expire=PORT_CACHE_TTL)
+    return coords
+
+# Weather is fine to reuse for a few minutes per ~1 km grid cell
+WEATHER_CACHE_TTL = 600  # seconds
+_weather_cache = TTLCache(maxsize=512, ttl=WEATHER_CACHE_TTL)
+_weather_cache_lock = threading.Lock()
 
 def get_weather(lat, lon):
     """
     Get live weather info from Open-Meteo API.
+    Non-empty results are cached for WEATHER_CACHE_TTL; error replies are not.
     """
+    key = (round(float(lat), 2), round(float(lon), 2))
+    with _weather_cache_lock:
+        weather = _weather_cache.get(key)
+    if weather:
+        return weather
     params = {
         "latitude": lat,
         "longitude": lon,
         "current_weather": True
     }
-    response = requests.get(OPEN_METEO_URL, params=params)
+    response = HTTP_SESSION.get(OPEN_METEO_URL, params=params)
     data = response.json()
-    return data.get("current_weather", {})
+    weather = data.get("current_weather", {})
+    if weather:
+        with _weather_cache_lock:
+            _weather_cache[key] = weather
+    return weather
 
 def query_ollama(prompt, model="llama3.1:8b"):
     """
@@ -41,19 +77,14 @@ def query_ollama(prompt, model="llama3.1:8b"):
     try:
         url = "http://localhost:11434/api/generate"
         payload = {"model": model, "prompt": prompt}
-        response = requests.post(url, json=payload, stream=True)
+        response = HTTP_SESSION.post(url, json=payload, stream=True)
         response.raise_for_status()
 
-        # Concatenate streaming chunks
-        output = ""
-        for line in response.iter_lines():
+        # Collect streaming chunks (one JSON object per line) and join once
+        parts = []
+        for line in response.iter_lines(chunk_size=8192, decode_unicode=True):
             if line:
-                chunk = line.decode("utf-8")
-                try:
-                    data = eval(chunk)  # parse JSON-like response
-                    output += data.get("response", "")
-                except Exception:
-                    continue
-        return output.strip()
+                parts.append(json.loads(line).get("response", ""))
+        return "".join(parts).strip()
     except Exception as e:
         return f"Ollama error: {e}"
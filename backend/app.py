@@ -1,28 +1,74 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import csv
 import datetime as dt
+import importlib.util
 import math
 import os
 import re
-import requests
-from difflib import get_close_matches
+import threading
+import numpy as np
+import orjson
+from rapidfuzz import fuzz, process
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from werkzeug.utils import secure_filename
 
+# ---- Optional: Numba JIT for hot numeric helpers (plain Python if missing) ----
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 # ---- External helpers that call free live APIs ----
-from api_helpers import get_port_coordinates, get_weather
+from api_helpers import HTTP_SESSION, get_port_coordinates, get_weather
 
 # ---- Optional: LLM engines (OpenAI primary, Ollama fallback) ----
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")
 
+# ---- OCR engine for scanned CPs (PaddleOCR primary, Tesseract fallback) ----
+OCR_ENGINE = os.getenv("OCR_ENGINE", "paddle")
+if OCR_ENGINE == "paddle" and importlib.util.find_spec("paddleocr") is None:
+    OCR_ENGINE = "tesseract"  # optional dependency, see requirements-ocr.txt
+# Processes per web worker for OCR; kept small since gunicorn runs many workers.
+# Each pool process that runs Paddle holds its own model (several hundred MB), so
+# a host can end up with gunicorn workers x OCR_WORKERS copies. Default to one
+# process per worker for Paddle; lower WEB_CONCURRENCY too on memory-tight hosts.
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "1" if OCR_ENGINE == "paddle" else "2"))
+
 # OCR + PDF helpers
-from pdf2image import convert_from_path
+from pdf2image import convert_from_bytes
 import pytesseract
-import PyPDF2
+import pypdfium2 as pdfium
+try:
+    import tesserocr  # in-process libtesseract; model loads once per worker
+except ImportError:
+    tesserocr = None
 
 # ------------------ Flask Config ------------------
+class OrjsonProvider(JSONProvider):
+    """Serialize jsonify() responses with orjson (much faster than stdlib json)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype="application/json"
+        )
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app, origins=["https://maritime-ai-frontend.onrender.com", "http://localhost:5173"], 
      methods=["GET", "POST", "OPTIONS"],
      allow_headers=["Content-Type"])
@@ -31,9 +77,6 @@ CORS(app, origins=["https://maritime-ai-frontend.onrender.com", "http://localhos
 def home():
     return jsonify({"message": "Maritime AI Backend is running!"})
 
-UPLOAD_FOLDER = "uploads"
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024  # 10 MB limit
 
 # ------------------ Aliases for Sailor-friendly Names ------------------
@@ -53,6 +96,31 @@ PORT_ALIASES = {
     "kandla port": "deendayal",
 }
 
+# ------------------ Local Port Database ------------------
+# Built by normalize_ports.py; consulted before any Nominatim lookup
+PORTS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "normalized_ports.csv")
+
+def load_port_db(path: str = PORTS_CSV) -> dict:
+    db = {}
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                try:
+                    lat, lon = row["Coordinates"].split(",")
+                    db[row["normalized"]] = (float(lat), float(lon))
+                except (KeyError, AttributeError, ValueError):
+                    continue
+    except FileNotFoundError:
+        app.logger.warning("Port database %s not found; using Nominatim only", path)
+    return db
+
+_PORT_DB = load_port_db()
+# Same ports as radian arrays with cos(lat) precomputed, for vectorized nearest-port scans
+_PORT_NAMES = list(_PORT_DB)
+_PORT_RAD = np.radians(np.array([_PORT_DB[n] for n in _PORT_NAMES], dtype=float).reshape(-1, 2))
+_PORT_LAT_RAD, _PORT_LON_RAD = _PORT_RAD[:, 0], _PORT_RAD[:, 1]
+_PORT_COS_LAT = np.cos(_PORT_LAT_RAD)
+
 # ------------------ Laytime Rules (sample) ------------------
 LAYTIME_RULES = {
     "mumbai": 72,
@@ -62,21 +130,68 @@ LAYTIME_RULES = {
     "shanghai": 90
 }
 
+# ------------------ CP Clause Patterns ------------------
+# Regex patterns to catch whole clauses (multi-line), compiled once at import
+_CP_PATTERNS = {k: re.compile(p) for k, p in {
+    "Laytime": r"(?is)laytime.*?(?=\n\s*\n|$)",
+    "Demurrage": r"(?is)demurrage.*?(?=\n\s*\n|$)",
+    "Dispatch": r"(?is)dispatch.*?(?=\n\s*\n|$)",
+    "Notice of Readiness": r"(?is)(notice of readiness|NOR).*?(?=\n\s*\n|$)",
+    "Freight": r"(?is)freight.*?(?=\n\s*\n|$)",
+    "Arbitration": r"(?is)arbitration.*?(?=\n\s*\n|$)",
+    "Law": r"(?is)(law|applicable law).*?(?=\n\s*\n|$)",
+    "Clause Numbers": r"(?im)^clause\s+\d+.*?(?=\n\s*\n|$)"
+}.items()}
+
+def cp_clause_summary(text: str) -> dict:
+    summary = {}
+    for key, pattern in _CP_PATTERNS.items():
+        matches = pattern.findall(text)
+        if matches:
+            summary[key] = [m.strip() for m in matches]
+    return summary
+
 # ------------------ Utilities ------------------
 EARTH_RADIUS_NM = 3440.065  # Nautical miles
 
-def _to_radians(deg: float) -> float:
-    return deg * math.pi / 180.0
+DEG_TO_RAD = math.pi / 180.0
 
+@njit(cache=True, fastmath=True)
 def haversine_nm(a_lat: float, a_lon: float, b_lat: float, b_lon: float) -> float:
-    dlat = _to_radians(b_lat - a_lat)
-    dlon = _to_radians(b_lon - a_lon)
-    lat1 = _to_radians(a_lat)
-    lat2 = _to_radians(b_lat)
+    dlat = (b_lat - a_lat) * DEG_TO_RAD
+    dlon = (b_lon - a_lon) * DEG_TO_RAD
+    lat1 = a_lat * DEG_TO_RAD
+    lat2 = b_lat * DEG_TO_RAD
     h = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
     return 2 * EARTH_RADIUS_NM * math.asin(math.sqrt(h))
 
+def _haversine_nm_rad(a_lat, a_lon, a_cos, b_lat, b_lon, b_cos):
+    # Inputs in radians with cos(lat) supplied, so callers can precompute it
+    dlat = b_lat - a_lat
+    dlon = b_lon - a_lon
+    h = np.sin(dlat/2)**2 + a_cos * b_cos * np.sin(dlon/2)**2
+    return 2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(h))
+
+def haversine_nm_vec(a_lat, a_lon, b_lat, b_lon):
+    """Vectorized haversine over arrays of coordinates (broadcasts like NumPy)."""
+    a_lat, a_lon, b_lat, b_lon = map(np.radians, (a_lat, a_lon, b_lat, b_lon))
+    return _haversine_nm_rad(a_lat, a_lon, np.cos(a_lat), b_lat, b_lon, np.cos(b_lat))
+
+def nearest_port(lat: float, lon: float):
+    """Closest port in the local database as (display, coords, nm), or Nones."""
+    if not _PORT_NAMES:
+        return None, None, None
+    la = math.radians(float(lat))
+    lo = math.radians(float(lon))
+    nm = _haversine_nm_rad(la, lo, math.cos(la), _PORT_LAT_RAD, _PORT_LON_RAD, _PORT_COS_LAT)
+    i = int(np.argmin(nm))
+    name = _PORT_NAMES[i]
+    return name.title(), _PORT_DB[name], float(nm[i])
+
 def distance_between_vessels(lat1, lon1, lat2, lon2):
+    if any(isinstance(v, (list, tuple, np.ndarray)) for v in (lat1, lon1, lat2, lon2)):
+        coords = [np.asarray(v, dtype=float) for v in (lat1, lon1, lat2, lon2)]
+        return haversine_nm_vec(*coords).tolist()
     return haversine_nm(float(lat1), float(lon1), float(lat2), float(lon2))
 
 def build_alerts(port_key: str):
@@ -92,8 +207,8 @@ def build_alerts(port_key: str):
 def get_location_from_ip(ip=None):
     try:
         if not ip or ip.startswith(("127.", "192.168.")) or ip == "0.0.0.0":
-            ip = requests.get("https://api.ipify.org", timeout=5).text.strip()
-        resp = requests.get(f"http://ip-api.com/json/{ip}", timeout=5).json()
+            ip = HTTP_SESSION.get("https://api.ipify.org", timeout=5).text.strip()
+        resp = HTTP_SESSION.get(f"http://ip-api.com/json/{ip}", timeout=5).json()
         if resp.get("status") == "success":
             city = resp.get("city", "Unknown city")
             country = resp.get("country", "Unknown country")
@@ -112,12 +227,105 @@ def resolve_port(name: str):
     if not name:
         return None, None
     query = normalize_port_name(name)
+    coords = _PORT_DB.get(query)
+    if coords:
+        return query.title(), coords
+    close = process.extractOne(query, _PORT_DB.keys(), scorer=fuzz.ratio, score_cutoff=85)
+    if close:
+        return close[0].title(), _PORT_DB[close[0]]
     for attempt in (query, f"Port of {query}", f"{query} port"):
         coords = get_port_coordinates(attempt)
         if coords:
             return attempt.title(), coords
     return None, None
 
+def resolve_ports(*names):
+    """Resolve several ports concurrently; returns (display, coords) per name.
+
+    Only the ports run in parallel; each one still tries its query variants
+    in order, so Nominatim sees at most one request per port at a time.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(names), 1)) as ex:
+        return list(ex.map(resolve_port, names))
+
+# ------------------ OCR Helper ------------------
+# One bounded pool per web worker, shared by all uploads and created on first use
+_OCR_POOL = None
+_OCR_POOL_LOCK = threading.Lock()
+
+def _ocr_pool() -> ProcessPoolExecutor:
+    global _OCR_POOL
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL is None:
+            _OCR_POOL = ProcessPoolExecutor(max_workers=max(OCR_WORKERS, 1))
+        return _OCR_POOL
+
+def _discard_ocr_pool(pool) -> None:
+    global _OCR_POOL
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL is pool:
+            _OCR_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _with_ocr_pool(fn):
+    # A dead child (e.g. OOM-killed) breaks the pool for good; replace it and retry once
+    for attempt in range(2):
+        pool = _ocr_pool()
+        try:
+            return fn(pool)
+        except BrokenProcessPool:
+            app.logger.warning("OCR pool broke; starting a new one")
+            _discard_ocr_pool(pool)
+            if attempt:
+                raise
+
+# Runs inside pool processes; each keeps one PyTessBaseAPI for its lifetime
+_TESS_API = None
+
+def _tesseract_page(page) -> str:
+    global _TESS_API
+    if tesserocr is None:
+        return pytesseract.image_to_string(page)
+    if _TESS_API is None:
+        _TESS_API = tesserocr.PyTessBaseAPI()
+    _TESS_API.SetImage(page)
+    return _TESS_API.GetUTF8Text()
+
+# Runs inside pool processes; the model is built on first use, never at import
+_PADDLE_OCR = None
+
+def _paddle_pages(pages) -> str:
+    global _PADDLE_OCR
+    if _PADDLE_OCR is None:
+        from paddleocr import PaddleOCR
+        _PADDLE_OCR = PaddleOCR(lang="en", device="cpu", enable_mkldnn=True,
+                                use_doc_orientation_classify=False,
+                                use_doc_unwarping=False,
+                                use_textline_orientation=False)
+    # PIL gives RGB; Paddle expects BGR arrays. One predict() call for the whole batch.
+    images = [np.array(page.convert("RGB"))[:, :, ::-1] for page in pages]
+    results = _PADDLE_OCR.predict(images)
+    return "\n".join("\n".join(res["rec_texts"]) for res in results)
+
+def ocr_pages(pages) -> str:
+    # OCR is long CPU work, so both engines run in the pool, off the web worker
+    def _try_paddle():
+        if OCR_ENGINE != "paddle":
+            return None
+        try:
+            return _with_ocr_pool(lambda pool: pool.submit(_paddle_pages, pages).result())
+        except Exception:
+            app.logger.exception("PaddleOCR failed, falling back to Tesseract")
+            return None
+
+    def _try_tesseract():
+        # Pages are independent, so OCR them across the shared pool
+        return _with_ocr_pool(lambda pool: "\n".join(pool.map(_tesseract_page, pages)))
+
+    # "" is a valid Paddle result (blank scan); only fall back when Paddle failed
+    text = _try_paddle()
+    return text if text is not None else _try_tesseract()
+
 # ------------------ LLM Helper ------------------
 def ask_llm_general(user_message: str, engine: str = None) -> str:
     engine = (engine or "").lower()
@@ -162,6 +370,71 @@ def ask_llm_general(user_message: str, engine: str = None) -> str:
         return _try_openai() or _try_ollama() or "(AI unavailable)"
     return _try_ollama() or "(AI unavailable)"
 
+# ------------------ Chat Command Handlers ------------------
+def _handle_distance(user_message: str):
+    txt = user_message.replace("distance", "", 1).strip()
+    if txt.startswith("from "):
+        txt = txt[5:].strip()
+    if " to " not in txt:
+        return jsonify({"reply": "Please use 'distance <from> to <to>'."})
+    from_name, to_name = map(str.strip, txt.split(" to ", 1))
+    (f_disp, f_coords), (t_disp, t_coords) = resolve_ports(from_name, to_name)
+    if f_coords and t_coords:
+        nm = haversine_nm(*f_coords, *t_coords)
+        return jsonify({"reply": f"Distance from {f_disp} to {t_disp} is {round(nm,1)} nautical miles."})
+    return jsonify({"reply": f"Could not resolve '{from_name}' or '{to_name}'."})
+
+def _handle_weather(user_message: str):
+    port_phrase = user_message.replace("weather", "", 1).strip()
+    if port_phrase.startswith("at "):
+        port_phrase = port_phrase[3:].strip()
+    if not port_phrase or "my location" in port_phrase:
+        ip = request.remote_addr
+        loc_text, lat, lon = get_location_from_ip(ip)
+        if lat and lon:
+            return jsonify({"reply": f"{loc_text} Weather: {get_weather(lat, lon)}"})
+        return jsonify({"reply": loc_text})
+    disp, coords = resolve_port(port_phrase)
+    if coords:
+        return jsonify({"reply": f"Weather at {disp}: {get_weather(*coords)}"})
+    return jsonify({"reply": f"Could not find '{port_phrase}'."})
+
+def _handle_alert(user_message: str):
+    port = re.search(r"at (.+)$", user_message)
+    port = port.group(1).strip() if port else "mumbai"
+    disp, _ = resolve_port(port)
+    alerts = build_alerts((disp or port).lower())
+    return jsonify({"reply": f"Alerts at {(disp or port).title()}: " + ' '.join(alerts)})
+
+def _handle_location(user_message: str):
+    ip = request.remote_addr
+    loc_text, _, _ = get_location_from_ip(ip)
+    return jsonify({"reply": loc_text})
+
+def _handle_laytime(user_message: str):
+    m = re.search(r"at (.+)$", user_message)
+    if m:
+        port = m.group(1).strip().lower()
+        hours = LAYTIME_RULES.get(port)
+        if hours:
+            return jsonify({"reply": f"Laytime at {port.title()} is {hours} hours."})
+        return jsonify({"reply": f"No laytime data for {port}. Known: {', '.join(LAYTIME_RULES)}"})
+    return jsonify({"reply": "Laytime is the time allowed for loading/unloading in charter parties."})
+
+# Commands recognised by their leading word, matched in one regex scan
+_PREFIX_COMMANDS = {
+    "distance": _handle_distance,
+    "weather": _handle_weather,
+    "alert": _handle_alert,
+}
+_CMD_RE = re.compile(r"^(?P<cmd>" + "|".join(_PREFIX_COMMANDS) + ")")
+
+# Commands recognised by a keyword anywhere in the message, checked in order
+_KEYWORD_COMMANDS = (
+    (("location", "where am i"), _handle_location),
+    (("laytime",), _handle_laytime),
+)
+
 # ------------------ Chat Endpoint ------------------
 @app.route("/chat", methods=["POST"])
 def chat():
@@ -170,56 +443,13 @@ def chat():
     engine = (payload.get("engine") or "").strip().lower()
 
     try:
-        if user_message.startswith("distance"):
-            txt = user_message.replace("distance", "", 1).strip()
-            if txt.startswith("from "):
-                txt = txt[5:].strip()
-            if " to " not in txt:
-                return jsonify({"reply": "Please use 'distance <from> to <to>'."})
-            from_name, to_name = map(str.strip, txt.split(" to ", 1))
-            f_disp, f_coords = resolve_port(from_name)
-            t_disp, t_coords = resolve_port(to_name)
-            if f_coords and t_coords:
-                nm = haversine_nm(*f_coords, *t_coords)
-                return jsonify({"reply": f"Distance from {f_disp} to {t_disp} is {round(nm,1)} nautical miles."})
-            return jsonify({"reply": f"Could not resolve '{from_name}' or '{to_name}'."})
-
-        if user_message.startswith("weather"):
-            port_phrase = user_message.replace("weather", "", 1).strip()
-            if port_phrase.startswith("at "):
-                port_phrase = port_phrase[3:].strip()
-            if not port_phrase or "my location" in port_phrase:
-                ip = request.remote_addr
-                loc_text, lat, lon = get_location_from_ip(ip)
-                if lat and lon:
-                    return jsonify({"reply": f"{loc_text} Weather: {get_weather(lat, lon)}"})
-                return jsonify({"reply": loc_text})
-            disp, coords = resolve_port(port_phrase)
-            if coords:
-                return jsonify({"reply": f"Weather at {disp}: {get_weather(*coords)}"})
-            return jsonify({"reply": f"Could not find '{port_phrase}'."})
-
-        if user_message.startswith("alert"):
-            port = re.search(r"at (.+)$", user_message)
-            port = port.group(1).strip() if port else "mumbai"
-            disp, _ = resolve_port(port)
-            alerts = build_alerts((disp or port).lower())
-            return jsonify({"reply": f"Alerts at {(disp or port).title()}: " + ' '.join(alerts)})
-
-        if "location" in user_message or "where am i" in user_message:
-            ip = request.remote_addr
-            loc_text, _, _ = get_location_from_ip(ip)
-            return jsonify({"reply": loc_text})
-
-        if "laytime" in user_message:
-            m = re.search(r"at (.+)$", user_message)
-            if m:
-                port = m.group(1).strip().lower()
-                hours = LAYTIME_RULES.get(port)
-                if hours:
-                    return jsonify({"reply": f"Laytime at {port.title()} is {hours} hours."})
-                return jsonify({"reply": f"No laytime data for {port}. Known: {', '.join(LAYTIME_RULES)}"})
-            return jsonify({"reply": "Laytime is the time allowed for loading/unloading in charter parties."})
+        m = _CMD_RE.match(user_message)
+        if m:
+            return _PREFIX_COMMANDS[m.group("cmd")](user_message)
+
+        for keywords, handler in _KEYWORD_COMMANDS:
+            if any(k in user_message for k in keywords):
+                return handler(user_message)
 
         return jsonify({"reply": ask_llm_general(user_message, engine=engine)})
 
@@ -236,49 +466,33 @@ def upload_cp():
         return jsonify({"error": "No selected file"}), 400
 
     filename = secure_filename(file.filename)
-    filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    file.save(filepath)
+    # Parse straight from the upload buffer; nothing needs to be written to disk
+    buf = file.stream.read()
 
     extracted = ""
     try:
         if filename.lower().endswith(".txt"):
-            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                extracted = f.read()
+            extracted = buf.decode("utf-8", errors="ignore")
 
         elif filename.lower().endswith(".pdf"):
-            # First try PyPDF2 text extraction
-            with open(filepath, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                for page in reader.pages:
-                    extracted += (page.extract_text() or "") + "\n"
+            # First try PDFium text extraction
+            pdf = pdfium.PdfDocument(buf)
+            try:
+                extracted = "\n".join(page.get_textpage().get_text_range() for page in pdf)
+                # PDFium emits \r\n line endings; keep clause output on plain \n as before
+                extracted = extracted.replace("\r\n", "\n")
+            finally:
+                pdf.close()
 
             # Fallback: OCR if PDF text is too small (likely scanned CP)
             if len(extracted.strip()) < 100:
-                pages = convert_from_path(filepath)
-                extracted = ""
-                for page in pages:
-                    extracted += pytesseract.image_to_string(page) + "\n"
+                pages = convert_from_bytes(buf, thread_count=os.cpu_count() or 1)
+                extracted = ocr_pages(pages)
 
     except Exception as e:
         extracted = f"(Could not extract text: {str(e)})"
 
-    # Regex patterns to catch whole clauses (multi-line)
-    patterns = {
-        "Laytime": r"(?is)laytime.*?(?=\n\s*\n|$)",
-        "Demurrage": r"(?is)demurrage.*?(?=\n\s*\n|$)",
-        "Dispatch": r"(?is)dispatch.*?(?=\n\s*\n|$)",
-        "Notice of Readiness": r"(?is)(notice of readiness|NOR).*?(?=\n\s*\n|$)",
-        "Freight": r"(?is)freight.*?(?=\n\s*\n|$)",
-        "Arbitration": r"(?is)arbitration.*?(?=\n\s*\n|$)",
-        "Law": r"(?is)(law|applicable law).*?(?=\n\s*\n|$)",
-        "Clause Numbers": r"(?im)^clause\s+\d+.*?(?=\n\s*\n|$)"
-    }
-
-    summary = {}
-    for key, pattern in patterns.items():
-        matches = re.findall(pattern, extracted)
-        if matches:
-            summary[key] = [m.strip() for m in matches]
+    summary = cp_clause_summary(extracted)
 
     # Fallback: if nothing found, let LLM summarize the CP
     if not summary and extracted and len(extracted) > 50:
@@ -287,8 +501,7 @@ def upload_cp():
 
     return jsonify({
         "message": f"File {filename} uploaded successfully!",
-        "summary": summary or {"note": "No content extracted"},
-        "path": filepath
+        "summary": summary or {"note": "No content extracted"}
     })
 
 @app.route("/documents/upload", methods=["POST"])
@@ -296,5 +509,6 @@ def upload_document():
     return upload_cp()
 
 # ------------------ Main ------------------
+# Production runs under gunicorn (see Procfile / gunicorn.conf.py); this is for local dev only
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    app.run(host="0.0.0.0", port=8000, debug=os.getenv("FLASK_DEBUG") == "1", threaded=True)
@@ -0,0 +1,13 @@
+import multiprocessing
+import os
+
+# Picked up automatically by `gunicorn app:app` (see Procfile).
+# gevent workers monkey-patch sockets, so the blocking requests calls in
+# api_helpers/app yield instead of holding a worker while waiting on I/O.
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# Each worker gets its own OCR pool (see OCR_WORKERS in app.py); with PaddleOCR
+# that means one model copy per worker, so size this to the host's memory.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gevent"
+worker_connections = 1000
+timeout = 120  # OCR of scanned CPs can take a while
@@ -1,18 +1,28 @@
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 
 INPUT_CSV = "ports.csv"
 OUTPUT_CSV = "normalized_ports.csv"
 
-# Read robustly (semicolon-separated, skip broken lines)
-df = pd.read_csv(INPUT_CSV, delimiter=";", on_bad_lines="skip")
+# Read robustly (semicolon-separated, skip broken lines), keeping only relevant columns
+table = pv.read_csv(
+    INPUT_CSV,
+    parse_options=pv.ParseOptions(delimiter=";", invalid_row_handler=lambda row: "skip"),
+    convert_options=pv.ConvertOptions(
+        include_columns=["Name", "Coordinates"],
+        column_types={"Name": pa.string(), "Coordinates": pa.string()},
+        strings_can_be_null=True,
+    ),
+)
 
-# Keep only relevant columns
-df = df[["Name", "Coordinates"]].dropna()
+# Normalize names (lowercase, stripped, no extra spaces) with Arrow's string kernels
+table = table.append_column(
+    "normalized", pc.utf8_trim_whitespace(pc.utf8_lower(table["Name"]))
+)
+table = table.drop_null()
 
-# Normalize names (lowercase, stripped, no extra spaces)
-df["normalized"] = df["Name"].str.lower().str.strip()
+# Save with Arrow's C++ writer (no pandas round-trip)
+pv.write_csv(table, OUTPUT_CSV)
 
-# Save
-df.to_csv(OUTPUT_CSV, index=False)
-
-print(f"✅ Normalized {len(df)} ports → {OUTPUT_CSV}")
+print(f"✅ Normalized {table.num_rows} ports → {OUTPUT_CSV}")